@@ -4,13 +4,20 @@ from .core import (
     process_data,
     generate_create_table,
     generate_insert_statements,
+    iter_data,
+    iter_insert_statements,
     load_data,
-    write_to_database
+    write_data_to_database,
+    write_sql_file
 )
-from .utils import validate_table_name, validate_file_exists
+from .utils import DB_URL_PREFIXES, validate_table_name, validate_file_exists
 import sys
+from itertools import islice
 from pprint import pprint
 
+# Rows printed as an INSERT statement when no output is given
+PREVIEW_ROWS = 3
+
 @click.group()
 def cli():
     """Convert JSON/CSV  data to SQL tables."""
@@ -48,7 +55,7 @@ def convert(
     Notes:
         - Preview mode shows schema and CREATE TABLE statement
         - Interactive mode lets you choose types: TEXT, INTEGER, REAL, DATE, BOOLEAN
-        - Without output, prints CREATE TABLE and first 3 INSERT statements
+        - Without output, prints CREATE TABLE and an INSERT statement for the first 3 rows
     """
     try:
         # Validate inputs
@@ -60,9 +67,6 @@ def convert(
                 f"Invalid table name: {table}. Table name must start with a letter and contain only letters, numbers, and underscores."
             )
         
-        # Load data first
-        data = load_data(file, format)
-        
         # Process the data
         schema, create_stmt, insert_stmts = process_data(
             file_path=file,
@@ -98,19 +102,18 @@ def convert(
             
             # Regenerate SQL with new schema
             schema = new_schema
+            data = load_data(file, format)
             create_stmt = generate_create_table(table, schema)
-            insert_stmts = generate_insert_statements(table, data, schema)
             
             # Write to output if specified
-            if output:
-                # if the output is a database url, write the sql to the database
-                if output.startswith(('sqlite:///', 'postgresql://')):
-                    write_to_database(create_stmt, insert_stmts, output)
-                # if the output is a file, write the sql to the file
-                else:
-                    with open(output, 'w') as f:
-                        f.write(create_stmt + '\n\n')
-                        f.write('\n'.join(insert_stmts))
+            # if the output is a database url, write the data to the database
+            if output and output.startswith(DB_URL_PREFIXES):
+                write_data_to_database(create_stmt, table, data, schema, output)
+            # if the output is a file, stream the sql to the file
+            elif output:
+                write_sql_file(output, create_stmt, iter_insert_statements(table, data, schema))
+            else:
+                insert_stmts = generate_insert_statements(table, data, schema)
 
         # Output results
         if output:
@@ -118,11 +121,13 @@ def convert(
         else:
             click.echo("\nGenerated SQL:")
             click.echo(create_stmt)
-            click.echo("\nFirst few INSERT statements:")
-            for stmt in insert_stmts[:3]:
+            # Each statement holds up to 1000 rows, so only the first rows are shown
+            rows = data[:PREVIEW_ROWS + 1] if interactive else list(islice(iter_data(file, format), PREVIEW_ROWS + 1))
+            click.echo(f"\nFirst {len(rows[:PREVIEW_ROWS])} rows as an INSERT statement:")
+            for stmt in generate_insert_statements(table, rows[:PREVIEW_ROWS], schema, batch_size=PREVIEW_ROWS):
                 click.echo(stmt)
-            if len(insert_stmts) > 3:
-                click.echo("... and more INSERT statements")
+            if len(rows) > PREVIEW_ROWS:
+                click.echo(f"... and more rows, {len(insert_stmts)} INSERT statement(s) in total")
 
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
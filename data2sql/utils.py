@@ -1,6 +1,16 @@
 from typing import Any, Dict, List
+from datetime import datetime
 from dateutil.parser import parse as parse_date
 import os
+import re
+
+# Output prefixes that are written to a database instead of a .sql file
+DB_URL_PREFIXES = ('sqlite:///', 'postgresql://', 'duckdb:///')
+
+# Cheap checks run before the expensive dateutil parser
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}')
+_TABLE_NAME_RE = re.compile(r'^[A-Za-z][A-Za-z0-9_]*\Z')
+_NON_FIELD_CHAR_RE = re.compile(r'[^A-Za-z0-9]')
 
 def infer_sql_type(value: Any) -> str:
     """Infer SQL data type from a Python value.
@@ -37,15 +47,18 @@ def validate_table_name(name: str) -> bool:
         bool: True if the name is valid, False otherwise.
             A valid table name:
             - Is not empty
-            - Contains only alphanumeric characters and underscores
-            - Not empty and does not start with a digit
+            - Contains only ASCII letters, digits and underscores
+            - Starts with a letter
     """
-    return (
-        name and
-        name.strip() and
-        name.replace('_', '').isalnum() and
-        not name[0].isdigit()
-    )
+    return bool(name and _TABLE_NAME_RE.match(name))
+
+def _try_fromisoformat(value: str) -> bool:
+    """Check if a string is an ISO 8601 date or datetime, without dateutil."""
+    try:
+        datetime.fromisoformat(value)
+        return True
+    except ValueError:
+        return False
 
 def is_valid_date(value: str) -> bool:
     """Check if a string represents a valid date.
@@ -57,12 +70,15 @@ def is_valid_date(value: str) -> bool:
         bool: True if value is a valid date (Y-M-D). False otherwise.
 
     """
+    # Reject anything not starting with YYYY-MM-DD before trying to parse it
+    if not isinstance(value, str) or not _DATE_RE.match(value):
+        return False
+    if _try_fromisoformat(value):
+        return True
     try:
-        date = parse_date(value)
-        formatted = date.strftime('%Y-%m-%d')
-        #Must be at least 8 chars (YYYYMMDD)
-        return len(value) >= 8  # Basic check to avoid just year values
-    except (ValueError, TypeError):
+        parse_date(value)  # e.g. '2024-03-15 10:00 UTC' which fromisoformat rejects
+        return True
+    except (ValueError, OverflowError):
         return False
 
 
@@ -76,7 +92,7 @@ def sanitize_field_name(name: str) -> str:
         str: A SQL-compatible field name where:
             - Special characters are replaced with underscores
             - Names starting with digits are prefixed with 'f_'
-            - Only alphanumeric characters and underscores remain
+            - Only ASCII letters, digits and underscores remain
 
     Usage:
         >>> sanitize_field_name("First Name!")
@@ -85,9 +101,9 @@ def sanitize_field_name(name: str) -> str:
         "f_123field"
     """
     # Replace spaces and special chars with underscore
-    sanitized = ''.join(c if c.isalnum() else '_' for c in name)
+    sanitized = _NON_FIELD_CHAR_RE.sub('_', name)
     # Check it doesn't start with a number
-    if sanitized[0].isdigit():
+    if sanitized[:1].isdigit():
         sanitized = f"f_{sanitized}"
     return sanitized
 
@@ -100,11 +116,11 @@ def validate_output_path(path: str) -> bool:
     Returns:
         bool: True if the path is valid, False otherwise.
             Valid paths are either:
-            - Database URLs starting with 'sqlite:///' or 'postgresql://'
+            - Database URLs starting with 'sqlite:///', 'postgresql://' or 'duckdb:///'
             - .sql file paths in existing directories
             - .sql file paths in the current directory
     """
-    if path.startswith(('sqlite:///', 'postgresql://')):
+    if path.startswith(DB_URL_PREFIXES):
         return True
     return (
         path.endswith('.sql') and
@@ -11,6 +11,10 @@ setup(
         "python-dateutil>=2.8.0",
         "tqdm>=4.65.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.0.0", "ijson>=3.1.0"],
+        "duckdb": ["duckdb>=0.9.0"],
+    },
     entry_points={
         'console_scripts': [
             'data2sql=data2sql.cli:main',
@@ -1,14 +1,26 @@
 import pytest
 from data2sql.core import (
+    _get_engine,
+    _str_type,
     infer_type,
     infer_schema,
+    infer_schema_lazy,
+    infer_schema_from_df,
     load_data,
+    iter_data,
     generate_create_table,
     generate_insert_statements,
-    process_data
+    iter_insert_statements,
+    iter_insert_rows,
+    process_data,
+    to_columns,
+    write_data_to_database
 )
 import json
 import sqlite3
+import pandas as pd
+from click.testing import CliRunner
+from data2sql.cli import cli
 from sqlalchemy import create_engine, text
 
 def test_infer_type():
@@ -20,6 +32,13 @@ def test_infer_type():
     assert infer_type("2024-03-15") == "DATE"
     assert infer_type("hello") == "TEXT"
 
+def test_infer_type_caches_strings():
+    """Test repeated string values reuse the cached type."""
+    infer_type("2024-03-16")
+    hits = _str_type.cache_info().hits
+    assert infer_type("2024-03-16") == "DATE"
+    assert _str_type.cache_info().hits == hits + 1
+
 def test_infer_schema(sample_json_data):
     """Test schema inference from JSON data."""
     schema = infer_schema(sample_json_data["players"])
@@ -32,6 +51,55 @@ def test_infer_schema(sample_json_data):
         "is_active": "BOOLEAN"
     }
 
+def test_infer_schema_skips_nulls():
+    """Test types come from the first non-null value of each column."""
+    data = [
+        {"name": None, "age": 25, "nickname": None},
+        {"name": "Vinicius Jr", "age": None, "nickname": None},
+    ]
+    assert infer_schema(data) == {"name": "TEXT", "age": "INTEGER", "nickname": "TEXT"}
+
+def test_infer_schema_sample_size():
+    """Test only the first sample_size rows are inspected."""
+    data = [{"name": "Vinicius Jr", "goals": None}] * 3 + [{"name": "Rodrygo", "goals": 7}]
+    assert infer_schema(data, sample_size=3) == {"name": "TEXT", "goals": "TEXT"}
+    assert infer_schema(data, sample_size=4) == {"name": "TEXT", "goals": "INTEGER"}
+
+def test_infer_schema_lazy():
+    """Test only the needed columns are type-inferred."""
+    data = [
+        {"name": "Vinicius Jr", "age": 23, "goals": 12, "xG": 10.5, "last_match": "2024-03-15", "is_active": True},
+        {"name": "Rodrygo", "age": None, "goals": 7, "xG": 4.25, "last_match": None, "is_active": False},
+    ]
+    schema = infer_schema_lazy(data, columns_needed=["age", "last_match"])
+    assert schema == {
+        "name": "TEXT",
+        "age": "INTEGER",
+        "goals": "TEXT",
+        "xG": "TEXT",
+        "last_match": "DATE",
+        "is_active": "TEXT"
+    }
+
+def test_infer_schema_from_df():
+    """Test schema inference from DataFrame dtypes."""
+    df = pd.DataFrame({
+        "home_team": ["Real Madrid", None],
+        "goals": [3, 1],
+        "possession": [55.5, None],
+        "date": ["2024-03-01", "2024-03-02"],
+        "home_win": [True, False],
+        "referee": [None, None]
+    })
+    assert infer_schema_from_df(df) == {
+        "home_team": "TEXT",
+        "goals": "INTEGER",
+        "possession": "REAL",
+        "date": "DATE",
+        "home_win": "BOOLEAN",
+        "referee": "TEXT"
+    }
+
 def test_load_data_json(player_stats_json):
     """Test loading JSON data."""
     data = load_data(player_stats_json, "json")
@@ -40,6 +108,54 @@ def test_load_data_json(player_stats_json):
     assert isinstance(data[0]["goals"], int)
     assert isinstance(data[0]["xG"], float)
 
+def test_iter_data_json_lines(tmp_path):
+    """Test streaming rows from JSON Lines and JSON array files."""
+    rows = [{"name": "Vinicius Jr", "xG": 10.5}, {"name": "Rodrygo", "xG": 4.25}]
+    jsonl_file = tmp_path / "players.jsonl"
+    jsonl_file.write_text("\n".join(json.dumps(row) for row in rows) + "\n\n")
+    array_file = tmp_path / "players.json"
+    array_file.write_text("  " + json.dumps(rows))
+
+    assert list(iter_data(str(jsonl_file))) == rows
+    assert list(iter_data(str(array_file))) == rows
+    assert infer_schema(iter_data(str(jsonl_file))) == {"name": "TEXT", "xG": "REAL"}
+
+    # JSON Lines without a .jsonl extension is detected by content
+    lines_file = tmp_path / "players_lines.json"
+    lines_file.write_text("\n".join(json.dumps(row) for row in rows))
+    wrapped_file = tmp_path / "players_wrapped.json"
+    wrapped_file.write_text(json.dumps({"players": rows}, indent=2))
+    for path in (lines_file, wrapped_file):
+        assert list(iter_data(str(path))) == rows
+        assert load_data(str(path)) == rows
+
+def test_iter_data_json_errors_and_nan(tmp_path):
+    """Test malformed arrays raise JSONDecodeError and NaN tokens are accepted."""
+    bad_file = tmp_path / "bad.json"
+    bad_file.write_text('[{"name": "Modric"}, {"name"')
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_data(str(bad_file)))
+    with pytest.raises(json.JSONDecodeError):
+        load_data(str(bad_file))
+
+    nan_file = tmp_path / "nan.json"
+    nan_file.write_text('[{"name": "Modric", "xG": 1.5}, {"name": "Kroos", "xG": NaN}]')
+    for rows in (list(iter_data(str(nan_file))), load_data(str(nan_file))):
+        assert [row["name"] for row in rows] == ["Modric", "Kroos"]
+        assert rows[1]["xG"] != rows[1]["xG"]  # NaN
+
+def test_process_json_streams_in_chunks(tmp_path, monkeypatch):
+    """Test JSON rows are rendered the same when converted to columns in chunks."""
+    monkeypatch.setattr("data2sql.core._STREAM_CHUNK_ROWS", 2)
+    rows = [{"name": f"Player {i}", "goals": i} for i in range(5)]
+    json_file = tmp_path / "players.json"
+    json_file.write_text(json.dumps(rows))
+
+    _, _, insert_stmts = process_data(file_path=str(json_file), table_name="players")
+    assert insert_stmts == generate_insert_statements("players", rows, {"name": "TEXT", "goals": "INTEGER"})
+    assert list(iter_insert_rows(iter(rows), {"goals": "INTEGER"}, batch_size=3)) == [
+        [{"goals": 0}, {"goals": 1}, {"goals": 2}], [{"goals": 3}, {"goals": 4}]]
+
 def test_load_data_csv(match_stats_csv):
     """Test loading CSV data."""
     data = load_data(match_stats_csv, "csv")
@@ -68,6 +184,25 @@ def test_generate_insert_statements():
     assert len(stmts) == 1
     assert "INSERT INTO players (name, age) VALUES ('Test', 25);" in stmts
 
+def test_generate_insert_statements_batches_rows():
+    """Test rows are batched into multi-row INSERTs with NULL for missing values."""
+    schema = {"name": "TEXT", "age": "INTEGER", "is_active": "BOOLEAN"}
+    data = [
+        {"name": "A", "age": 1, "is_active": True},
+        {"name": "B", "age": None, "is_active": False},
+        {"name": "C", "age": 3, "is_active": False},
+        {"name": "D'Souza", "age": 4, "is_active": True},
+    ]
+    stmts = generate_insert_statements("players", data, schema, batch_size=2)
+    assert stmts == [
+        "INSERT INTO players (name, age, is_active) VALUES ('A', 1, 1), ('B', NULL, 0);",
+        "INSERT INTO players (name, age, is_active) VALUES ('C', 3, 0), ('D''Souza', 4, 1);",
+    ]
+    with pytest.raises(ValueError):
+        generate_insert_statements("players", data, schema, batch_size=0)
+    with pytest.raises(ValueError):
+        list(iter_insert_rows(data, schema, batch_size=0))
+
 def test_process_data_to_sql_file(player_stats_json, temp_sql_file):
     """Test end-to-end processing to SQL file."""
     schema, create_stmt, insert_stmts = process_data(
@@ -83,6 +218,32 @@ def test_process_data_to_sql_file(player_stats_json, temp_sql_file):
         assert "CREATE TABLE IF NOT EXISTS players" in content
         assert "INSERT INTO players" in content
 
+def test_process_data_returns_statements_only_without_output(tmp_path):
+    """Test INSERT statements are returned without an output and streamed to a file otherwise."""
+    json_file = tmp_path / "players.json"
+    json_file.write_text(json.dumps([{"name": "Vinicius Jr", "goals": 12}, {"name": "Rodrygo", "goals": None}]))
+    sql_file = tmp_path / "players.sql"
+    expected = ["INSERT INTO players (name, goals) VALUES ('Vinicius Jr', 12), ('Rodrygo', NULL);"]
+
+    _, _, insert_stmts = process_data(file_path=str(json_file), table_name="players")
+    assert insert_stmts == expected
+
+    _, create_stmt, insert_stmts = process_data(file_path=str(json_file), table_name="players", output=str(sql_file))
+    assert insert_stmts == []
+    assert sql_file.read_text() == create_stmt + "\n\n" + expected[0] + "\n"
+
+def test_process_data_keeps_sql_file_on_error(tmp_path):
+    """Test malformed JSON after the schema sample leaves the output file untouched."""
+    json_file = tmp_path / "players.json"
+    json_file.write_text(json.dumps([{"name": f"Player {i}"} for i in range(2500)])[:-1] + ', {"name"')
+    sql_file = tmp_path / "players.sql"
+    sql_file.write_text("-- previous run\n")
+
+    with pytest.raises(json.JSONDecodeError):
+        process_data(file_path=str(json_file), table_name="players", output=str(sql_file))
+    assert sql_file.read_text() == "-- previous run\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["players.json", "players.sql"]
+
 def test_process_data_to_database(player_stats_json, temp_db):
     """Test end-to-end processing to database."""
     schema, create_stmt, insert_stmts = process_data(
@@ -101,3 +262,167 @@ def test_process_data_to_database(player_stats_json, temp_db):
         result = conn.execute(text("SELECT name, goals FROM players WHERE name = 'Vinicius Jr'")).first()
         assert result[0] == "Vinicius Jr"
         assert result[1] == 12
+
+def test_iter_insert_statements():
+    """Test statements are yielded lazily, one batch at a time."""
+    schema = {"name": "TEXT", "age": "INTEGER"}
+    data = [{"name": "A", "age": 1}, {"name": "B", "age": 2}, {"name": "C", "age": 3}]
+    stmts = iter_insert_statements("players", data, schema, batch_size=2)
+    assert next(stmts) == "INSERT INTO players (name, age) VALUES ('A', 1), ('B', 2);"
+    assert list(stmts) == ["INSERT INTO players (name, age) VALUES ('C', 3);"]
+
+def test_iter_insert_statements_compiled_formatter(monkeypatch):
+    """Test the compiled row formatter renders the same SQL as the column path."""
+    schema = {"name": "TEXT", "age": "INTEGER", "xG": "REAL", "is_active": "BOOLEAN", "last_match": "DATE"}
+    data = [
+        {"name": "D'Souza", "age": 30, "xG": 1.5, "is_active": True, "last_match": "2024-03-15"},
+        {"name": None, "age": None, "xG": None, "is_active": False, "last_match": None},
+        {"name": float("nan"), "age": 7, "xG": float("nan"), "is_active": True, "last_match": float("nan")},
+    ]
+    expected = generate_insert_statements("players", data, schema)
+    monkeypatch.setattr("data2sql.core._CODEGEN_MIN_ROWS", 0)
+    assert generate_insert_statements("players", data, schema) == expected
+
+def test_to_columns():
+    """Test rows are converted to column-oriented data in schema order."""
+    schema = {"name": "TEXT", "age": "INTEGER"}
+    data = [{"age": 25, "name": "Test"}, {"name": "Rodrygo"}]
+    columns = to_columns(data, schema)
+    assert columns == {"name": ["Test", "Rodrygo"], "age": [25, None]}
+    assert list(columns) == ["name", "age"]
+    assert generate_insert_statements("players", columns, schema) == [
+        "INSERT INTO players (name, age) VALUES ('Test', 25), ('Rodrygo', NULL);",
+    ]
+
+def test_generate_insert_statements_from_dataframe():
+    """Test INSERT generation from a DataFrame, with NaN treated as NULL."""
+    schema = {"team": "TEXT", "goals": "INTEGER", "xG": "REAL", "home": "BOOLEAN"}
+    df = pd.DataFrame({
+        "team": ["Real Madrid", "Girona"],
+        "goals": [3, 1],
+        "xG": [2.5, float("nan")],
+        "home": [True, False]
+    })
+    stmts = generate_insert_statements("matches", df, schema)
+    assert stmts == [
+        "INSERT INTO matches (team, goals, xG, home) VALUES ('Real Madrid', 3, 2.5, 1), ('Girona', 1, NULL, 0);",
+    ]
+
+def test_iter_insert_rows():
+    """Test rows are batched as parameter dictionaries with plain Python values."""
+    schema = {"team": "TEXT", "goals": "INTEGER", "xG": "REAL"}
+    df = pd.DataFrame({"team": ["Real Madrid", "Girona", "Betis"], "goals": [3, 1, 0], "xG": [2.5, float("nan"), 0.4]})
+    batches = list(iter_insert_rows(df, schema, batch_size=2))
+    assert batches == [
+        [{"team": "Real Madrid", "goals": 3, "xG": 2.5}, {"team": "Girona", "goals": 1, "xG": None}],
+        [{"team": "Betis", "goals": 0, "xG": 0.4}],
+    ]
+    assert type(batches[0][0]["goals"]) is int
+
+    nested = [{"name": "Ali", "team": {"id": 7}}]
+    schema = {"name": "TEXT", "team": "TEXT"}
+    assert list(iter_insert_rows(nested, schema)) == [[{"name": "Ali", "team": "{'id': 7}"}]]
+
+def test_write_data_to_database(tmp_path):
+    """Test rows are inserted with bound parameters, including NULLs and quotes."""
+    url = f"sqlite:///{tmp_path / 'players.db'}"
+    schema = {"name": "TEXT", "age": "INTEGER"}
+    data = [{"name": "D'Souza", "age": 30}, {"name": "Rodrygo"}, {"name": "Valverde", "age": None}]
+    create_stmt = generate_create_table("players", schema)
+    write_data_to_database(create_stmt, "players", data, schema, url, batch_size=2)
+
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT name, age FROM players ORDER BY name")).all()
+        journal_mode = conn.execute(text("PRAGMA journal_mode")).scalar()
+    assert rows == [("D'Souza", 30), ("Rodrygo", None), ("Valverde", None)]
+    assert journal_mode == "wal"
+
+def test_write_data_to_duckdb(tmp_path):
+    """Test a table named df and nested JSON are written to DuckDB as text."""
+    duckdb = pytest.importorskip("duckdb")
+    path = tmp_path / "players.duckdb"
+    schema = {"name": "TEXT", "club": "TEXT", "joined": "DATE"}
+    data = [{"name": "Bellingham", "club": {"id": 7, "name": "Real Madrid"}, "joined": "2023-07-01"}]
+    create_stmt = generate_create_table("df", schema)
+    write_data_to_database(create_stmt, "df", data, schema, f"duckdb:///{path}")
+
+    con = duckdb.connect(str(path))
+    try:
+        rows = con.execute("SELECT name, club, CAST(joined AS VARCHAR) FROM df").fetchall()
+    finally:
+        con.close()
+    assert rows == [("Bellingham", "{'id': 7, 'name': 'Real Madrid'}", "2023-07-01")]
+
+def test_write_data_to_duckdb_rejects_date_times(tmp_path):
+    """Test a DATE value with a time of day is not silently truncated by DuckDB."""
+    pytest.importorskip("duckdb")
+    schema = {"kickoff": "DATE"}
+    create_stmt = generate_create_table("matches", schema)
+    with pytest.raises(ValueError, match="kickoff"):
+        write_data_to_database(create_stmt, "matches", [{"kickoff": "2024-03-01 10:00:00"}],
+                               schema, f"duckdb:///{tmp_path / 'matches.duckdb'}")
+
+def test_get_engine_is_reused(tmp_path):
+    """Test the engine for a URL is created once and reused."""
+    url = f"sqlite:///{tmp_path / 'players.db'}"
+    assert _get_engine(url) is _get_engine(url)
+
+def test_write_data_to_database_after_file_deleted(tmp_path):
+    """Test a SQLite file deleted between writes is created again, not written to the old inode."""
+    db_file = tmp_path / "players.db"
+    url = f"sqlite:///{db_file}"
+    schema = {"name": "TEXT"}
+    create_stmt = generate_create_table("players", schema)
+    write_data_to_database(create_stmt, "players", [{"name": "Modric"}], schema, url)
+    db_file.unlink()
+    write_data_to_database(create_stmt, "players", [{"name": "Kroos"}], schema, url)
+
+    with sqlite3.connect(db_file) as conn:
+        assert conn.execute("SELECT name FROM players").fetchall() == [("Kroos",)]
+
+def test_process_csv_to_database(tmp_path):
+    """Test the CSV DataFrame is bulk loaded into the database."""
+    csv_file = tmp_path / "matches.csv"
+    csv_file.write_text("home_team,possession_home\nReal Madrid,55.5\nGirona,\n")
+    url = f"sqlite:///{tmp_path / 'matches.db'}"
+    _, _, insert_stmts = process_data(file_path=str(csv_file), table_name="matches", format="csv", output=url)
+
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT home_team, possession_home FROM matches")).all()
+    assert rows == [("Real Madrid", 55.5), ("Girona", None)]
+    assert insert_stmts == []  # rows are bound, no INSERT text is rendered
+
+def test_convert_interactive_writes_nulls(tmp_path):
+    """Test the interactive CLI path writes NULL for empty CSV cells."""
+    csv_file = tmp_path / "matches.csv"
+    csv_file.write_text("team,xG,date,home\nReal Madrid,1.5,2024-03-01,True\n,,,\n")
+    url = f"sqlite:///{tmp_path / 'matches.db'}"
+    sql_file = tmp_path / "matches.sql"
+
+    runner = CliRunner()
+    for output in (url, str(sql_file)):
+        result = runner.invoke(
+            cli,
+            ["convert", "--file", str(csv_file), "--table", "matches", "--interactive", "--output", output],
+            input="\n" * 4
+        )
+        assert result.exit_code == 0, result.output
+
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT team, xG, date, home FROM matches")).all()
+    assert rows == [("Real Madrid", 1.5, "2024-03-01", 1), (None, None, None, None)]
+    assert "('Real Madrid', 1.5, '2024-03-01', 1), (NULL, NULL, NULL, NULL);" in sql_file.read_text()
+
+def test_convert_without_output_prints_first_rows(tmp_path):
+    """Test only the first rows are printed when there is no output."""
+    json_file = tmp_path / "players.json"
+    json_file.write_text(json.dumps([{"name": f"Player {i}", "goals": i} for i in range(2500)]))
+
+    result = CliRunner().invoke(cli, ["convert", "--file", str(json_file), "--table", "players"])
+    assert result.exit_code == 0, result.output
+    assert "INSERT INTO players (name, goals) VALUES ('Player 0', 0), ('Player 1', 1), ('Player 2', 2);" in result.output
+    assert "Player 3'" not in result.output
+    assert "3 INSERT statement(s) in total" in result.output
@@ -0,0 +1,29 @@
+import pytest
+from data2sql.utils import is_valid_date, sanitize_field_name, validate_table_name
+
+def test_is_valid_date():
+    """Test date detection for ISO and non-ISO strings."""
+    assert is_valid_date("2024-03-15")
+    assert is_valid_date("2024-03-15T20:00:00")
+    assert is_valid_date("2024-03-15 20:00 UTC")
+    assert not is_valid_date("2024-13-45")
+    assert not is_valid_date("hello")
+    assert not is_valid_date("12")
+    assert not is_valid_date(None)
+
+def test_validate_table_name():
+    """Test table name validation."""
+    assert validate_table_name("player_stats")
+    assert validate_table_name("Players2024")
+    assert not validate_table_name("")
+    assert not validate_table_name("2024_players")
+    assert not validate_table_name("player stats")
+    assert not validate_table_name("players;")
+    assert not validate_table_name("_players")
+    assert not validate_table_name("players\n")
+
+def test_sanitize_field_name():
+    """Test field names are made SQL-compatible."""
+    assert sanitize_field_name("First Name!") == "First_Name_"
+    assert sanitize_field_name("123field") == "f_123field"
+    assert sanitize_field_name("xG_per_90") == "xG_per_90"